@@ -113,7 +113,7 @@ cecho "${YELLOW}[1/7] Compiling Swift Core...${NC}"
 mkdir -p "$INSTALL_DIR/Contents/MacOS"
 
 SWIFT_DIR="$SCRIPT_DIR/swift"
-SWIFT_FILES="Logger.swift PermissionManager.swift AppDelegate.swift SettingsWindow.swift Main.swift"
+SWIFT_FILES="Logger.swift PermissionManager.swift NotificationServer.swift AppDelegate.swift SettingsWindow.swift Main.swift"
 
 for swiftfile in $SWIFT_FILES; do
     if [ ! -f "$SWIFT_DIR/$swiftfile" ]; then
@@ -125,6 +125,7 @@ done
 swiftc \
     "$SWIFT_DIR/Logger.swift" \
     "$SWIFT_DIR/PermissionManager.swift" \
+    "$SWIFT_DIR/NotificationServer.swift" \
     "$SWIFT_DIR/AppDelegate.swift" \
     "$SWIFT_DIR/SettingsWindow.swift" \
     "$SWIFT_DIR/Main.swift" \
@@ -199,7 +200,7 @@ cecho "${GREEN}✅ App Registered with macOS Notification Center${NC}"
 cecho "${YELLOW}[3/7] Installing Managers...${NC}"
 
 # Check required Python files
-for pyfile in api_manager.py account_manager.py hook.py notification_hook.py stop_hook.py; do
+for pyfile in api_manager.py account_manager.py _manager_common.py _hook_common.py hook.py notification_hook.py stop_hook.py; do
     if [ ! -f "$SCRIPT_DIR/python/$pyfile" ]; then
         cecho "${RED}❌ Error: $pyfile not found in $SCRIPT_DIR/python/${NC}"
         exit 1
@@ -207,6 +208,8 @@ for pyfile in api_manager.py account_manager.py hook.py notification_hook.py sto
 done
 
 # Copy all Python scripts
+cp "$SCRIPT_DIR/python/_manager_common.py" "$BASE_DIR/_manager_common.py"
+cp "$SCRIPT_DIR/python/_hook_common.py" "$BASE_DIR/_hook_common.py"
 cp "$SCRIPT_DIR/python/hook.py" "$BASE_DIR/hook.py"
 cp "$SCRIPT_DIR/python/notification_hook.py" "$BASE_DIR/notification_hook.py"
 cp "$SCRIPT_DIR/python/stop_hook.py" "$BASE_DIR/stop_hook.py"
@@ -214,6 +217,9 @@ cp "$SCRIPT_DIR/python/api_manager.py" "$API_MANAGER_SCRIPT"
 cp "$SCRIPT_DIR/python/account_manager.py" "$ACCOUNT_MANAGER_SCRIPT"
 
 chmod +x "$BASE_DIR/"*.py
+
+# Pre-compile the shared modules (scripts run as __main__ and are never cached)
+python3 -m compileall -q "$BASE_DIR/_hook_common.py" "$BASE_DIR/_manager_common.py" >/dev/null 2>&1 || true
 cecho "${GREEN}✅ Scripts installed${NC}"
 
 # ================= Generate Shell Config =================
@@ -248,9 +254,8 @@ _claude_wrapper() {
 
     # 1. Detect Window IMMEDIATELY (before any processing)
     local detected_info=\$("\$_CLAUDE_MON_APP" detect 2>/dev/null)
-    local detected_bundle=\$(echo "\$detected_info" | cut -d'|' -f1)
-    local detected_pid=\$(echo "\$detected_info" | cut -d'|' -f2)
-    local detected_window_id=\$(echo "\$detected_info" | cut -d'|' -f3)
+    local detected_bundle detected_pid detected_window_id
+    IFS='|' read -r detected_bundle detected_pid detected_window_id <<< "\$detected_info"
 
     # 3. Parse Arguments
     local -a claude_args
@@ -0,0 +1,122 @@
+"""
+_hook_common.py - Shared helpers for the Claude Code hook scripts
+Imported by hook.py, notification_hook.py and stop_hook.py (installed side by side)
+"""
+import atexit
+import json
+import os
+import sys
+import time
+from functools import lru_cache
+
+# Resolve HOME once; expanduser may fall back to a pwd lookup on every call
+HOME = os.environ.get('HOME') or os.path.expanduser('~')
+LOG_FILE = f"{HOME}/.claude-hooks/python_debug.log"
+BIN_PATH = f"{HOME}/Applications/ClaudeMonitor.app/Contents/MacOS/ClaudeMonitor"
+MONITOR_SOCK = f"{HOME}/.claude-hooks/monitor.sock"
+
+# Debug logging is opt-in: export CLAUDE_HOOK_DEBUG=1 to write python_debug.log
+DEBUG = bool(os.environ.get('CLAUDE_HOOK_DEBUG'))
+
+_LOG_BUF = []
+
+def _buffer_log(tag, fmt, *args):
+    """Queue a debug log line; the whole buffer is written once at exit"""
+    msg = fmt % args if args else fmt
+    _LOG_BUF.append(f"[{time.strftime('%H:%M:%S')}] [{tag}] {msg}\n")
+
+def _no_log(tag, fmt, *args):
+    pass
+
+def _flush_log():
+    if not _LOG_BUF:
+        return
+    # One raw append write for the whole buffer, bypassing the text I/O stack
+    try:
+        fd = os.open(LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+        try:
+            os.write(fd, ''.join(_LOG_BUF).encode('utf-8'))
+        finally:
+            os.close(fd)
+    except: pass
+
+if DEBUG:
+    log = _buffer_log
+    atexit.register(_flush_log)
+else:
+    log = _no_log
+
+def tagged_log(prefix):
+    """Return a log function that prepends prefix to every tag
+
+    Messages are %-style templates formatted only when debug logging is on, e.g.
+    log("SEND", "Sending: %s", title), so disabled logging costs just the call.
+    """
+    if not DEBUG:
+        return _no_log
+    return lambda tag, fmt, *args: _buffer_log(prefix + tag, fmt, *args)
+
+def read_hook_input(required_key=None):
+    """Parse the hook's JSON payload straight from the raw stdin bytes
+
+    If required_key is given and the key doesn't appear in the raw bytes, return {}
+    without parsing: the caller would bail out on the missing field anyway.
+    """
+    raw = sys.stdin.buffer.read()
+    if required_key and f'"{required_key}"'.encode() not in raw:
+        return {}
+    # Stdlib json on purpose: payloads are small, and importing orjson costs more than it saves
+    return json.loads(raw)
+
+@lru_cache(maxsize=1)
+def get_account_alias():
+    """Get account alias from environment variable or infer from config path"""
+    # Prefer explicit alias set by wrapper
+    alias = os.environ.get('CLAUDE_ACCOUNT_ALIAS')
+    if alias:
+        return alias
+
+    # Fallback: infer from CLAUDE_CONFIG_DIR
+    config_dir = os.environ.get('CLAUDE_CONFIG_DIR', '')
+    if config_dir:
+        basename = os.path.basename(config_dir)
+        if basename == '.claude':
+            return 'default'
+        elif basename.startswith('.claude-'):
+            return basename[8:]  # Remove '.claude-' prefix
+
+    return 'default'
+
+@lru_cache(maxsize=1)
+def get_terminal_env():
+    """Return (bundle_id, pid, cg_window_id) that _claude_wrapper captured before Claude started"""
+    env = os.environ
+    return (
+        env.get('CLAUDE_TERM_BUNDLE_ID', 'com.apple.Terminal'),
+        env.get('CLAUDE_TERM_PID', '0'),
+        env.get('CLAUDE_CG_WINDOW_ID', '0'),
+    )
+
+def send_notification(title, body, sound, bundle_id, pid, window_id):
+    """Hand a notification to the running ClaudeMonitor, or spawn the notifier if none is listening"""
+    # Imported here: most stop_hook runs never notify, and these two dominate import time
+    import socket
+
+    request = {
+        "title": title, "message": body, "sound": sound,
+        "bundle_id": bundle_id, "pid": str(pid), "window_id": str(window_id)
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+            s.settimeout(1)
+            s.connect(MONITOR_SOCK)
+            s.sendall(json.dumps(request).encode() + b"\n")
+        return
+    except OSError:
+        pass
+
+    import subprocess
+
+    # Fire and forget: the Swift notifier posts asynchronously, so don't hold the hook open
+    subprocess.Popen([BIN_PATH, "notify", title, body, sound, bundle_id, str(pid), str(window_id)],
+                     stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
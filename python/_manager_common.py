@@ -0,0 +1,45 @@
+"""
+_manager_common.py - Shared helpers for the account and API manager scripts
+Imported by account_manager.py and api_manager.py (installed side by side)
+"""
+import json
+import os
+
+def load_json(path):
+    """Load a JSON config file, returning {} if it is missing or unreadable"""
+    try:
+        with open(path, 'rb') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+def save_json(path, obj):
+    """Write obj to path atomically, leaving the file untouched when nothing changed"""
+    data = json.dumps(obj, indent=2).encode()
+    # Follow a symlinked config so the rename below updates its target, not the link
+    path = os.path.realpath(path)
+
+    # Compare raw bytes: an undecodable old file is simply treated as changed
+    mode = None
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return
+            mode = os.fstat(f.fileno()).st_mode & 0o777
+    except OSError:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Write a sibling temp file and rename it over the config so readers never see a partial file.
+    # The temp file gets the config's permissions before any data goes in (API keys live here).
+    tmp_path = path + '.tmp'
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666 if mode is None else mode)
+        with os.fdopen(fd, 'wb') as f:
+            if mode is not None:
+                os.fchmod(fd, mode)
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try: os.unlink(tmp_path)
+        except OSError: pass
+        raise
@@ -1,25 +1,33 @@
 #!/usr/bin/env python3
 import os
 import json
+import re
 import sys
-import argparse
+
+from _manager_common import load_json, save_json
 
 CONFIG_FILE = os.path.expanduser("~/.claude-hooks/accounts.json")
 SHELL_CONFIG = os.path.expanduser("~/.claude-hooks/config.sh")
+ALIAS_SECTION_MARKER = "# --- User Aliases ---"
+OLD_ALIAS_BLOCK_RE = re.compile(r"(?:alias [^\n]*_claude_wrapper[^\n]*(?:\n|$))*")
+HOOK_SCRIPT = os.path.expanduser("~/.claude-hooks/notification_hook.py")
+STOP_HOOK = os.path.expanduser("~/.claude-hooks/stop_hook.py")
+
+# Hooks written into each account's settings.json (only serialized, never mutated)
+_NOTIF_HOOK = {"type": "command", "command": HOOK_SCRIPT, "timeout": 10}
+HOOKS_CONFIG = {
+    "Notification": [
+        {"matcher": matcher, "hooks": [_NOTIF_HOOK]}
+        for matcher in ("idle_prompt", "permission_prompt", "elicitation_dialog", "auth_success", "")
+    ],
+    "Stop": [{"hooks": [{"type": "command", "command": STOP_HOOK, "timeout": 15}]}]
+}
 
 def load_config():
-    if not os.path.exists(CONFIG_FILE):
-        return {}
-    try:
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    except:
-        return {}
+    return load_json(CONFIG_FILE)
 
 def save_config(config):
-    os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    save_json(CONFIG_FILE, config)
 
 def update_shell_config(accounts):
     """Update config.sh with new aliases"""
@@ -29,40 +37,23 @@ def update_shell_config(accounts):
         return False
 
     with open(SHELL_CONFIG, 'r') as f:
-        lines = f.readlines()
-
-    # Find the "# --- User Aliases ---" section or end of file
-    new_lines = []
-    in_alias_section = False
-    alias_section_found = False
-
-    for line in lines:
-        if '# --- User Aliases ---' in line:
-            in_alias_section = True
-            alias_section_found = True
-            new_lines.append(line)
-            # Add all account aliases
-            for alias, path in accounts.items():
-                new_lines.append(f"alias {alias}='_claude_wrapper \"{path}\"'\n")
-            continue
-
-        if in_alias_section:
-            # Skip old alias lines
-            if line.startswith('alias ') and '_claude_wrapper' in line:
-                continue
-            else:
-                in_alias_section = False
+        text = f.read()
 
-        new_lines.append(line)
+    alias_lines = ''.join(f"alias {alias}='_claude_wrapper \"{path}\"'\n" for alias, path in accounts.items())
 
-    # If no alias section found, append at end
-    if not alias_section_found:
-        new_lines.append("\n# --- User Aliases ---\n")
-        for alias, path in accounts.items():
-            new_lines.append(f"alias {alias}='_claude_wrapper \"{path}\"'\n")
+    # Split once on the "# --- User Aliases ---" marker instead of scanning line by line
+    head, marker, tail = text.partition(ALIAS_SECTION_MARKER)
+    if marker:
+        marker_rest, _, tail = tail.partition('\n')
+        # Drop the old alias block directly under the marker, keep everything after it
+        tail = tail[OLD_ALIAS_BLOCK_RE.match(tail).end():]
+        text = f"{head}{marker}{marker_rest}\n{alias_lines}{tail}"
+    else:
+        # If no alias section found, append at end
+        text += f"\n{ALIAS_SECTION_MARKER}\n{alias_lines}"
 
     with open(SHELL_CONFIG, 'w') as f:
-        f.writelines(new_lines)
+        f.write(text)
 
     return True
 
@@ -74,9 +65,11 @@ def add_account(alias, path, configure_hooks=False):
         path = os.path.expanduser(path)
 
     # Create directory if not exists
-    if not os.path.exists(path):
-        os.makedirs(path, exist_ok=True)
+    try:
+        os.makedirs(path)
         print(f"📁 Created directory: {path}")
+    except FileExistsError:
+        pass
 
     config[alias] = path
     save_config(config)
@@ -113,43 +106,49 @@ def list_accounts():
 
     print("Configured Accounts:")
     for alias, path in config.items():
-        exists = "✓" if os.path.exists(path) else "✗"
+        try:
+            os.stat(path)
+            exists = "✓"
+        except OSError:
+            exists = "✗"
         print(f"  🔹 {alias} -> {path} [{exists}]")
 
 def configure_hooks_for_account(config_path):
     """Configure hooks for an account"""
-    hook_script = os.path.expanduser("~/.claude-hooks/notification_hook.py")
-    stop_hook = os.path.expanduser("~/.claude-hooks/stop_hook.py")
     settings_file = os.path.join(config_path, "settings.json")
 
-    hooks_config = {
-        "Notification": [
-            {"matcher": "idle_prompt", "hooks": [{"type": "command", "command": hook_script, "timeout": 10}]},
-            {"matcher": "permission_prompt", "hooks": [{"type": "command", "command": hook_script, "timeout": 10}]},
-            {"matcher": "elicitation_dialog", "hooks": [{"type": "command", "command": hook_script, "timeout": 10}]},
-            {"matcher": "auth_success", "hooks": [{"type": "command", "command": hook_script, "timeout": 10}]},
-            {"matcher": "", "hooks": [{"type": "command", "command": hook_script, "timeout": 10}]}
-        ],
-        "Stop": [{"hooks": [{"type": "command", "command": stop_hook, "timeout": 15}]}]
-    }
-
     try:
-        if os.path.exists(settings_file):
-            with open(settings_file, 'r') as f:
-                settings = json.load(f)
-        else:
-            settings = {"$schema": "https://json.schemastore.org/claude-code-settings.json"}
+        # One open for both the read and the rewrite
+        try:
+            f = open(settings_file, 'r+')
+        except FileNotFoundError:
+            f = open(settings_file, 'w+')
+
+        with f:
+            text = f.read()
+            if text:
+                settings = json.loads(text)
+            else:
+                settings = {"$schema": "https://json.schemastore.org/claude-code-settings.json"}
 
-        settings['hooks'] = hooks_config
+            settings['hooks'] = HOOKS_CONFIG
 
-        with open(settings_file, 'w') as f:
+            f.seek(0)
             json.dump(settings, f, indent=2)
+            f.truncate()
 
         print(f"✅ Hooks configured in {settings_file}")
     except Exception as e:
         print(f"❌ Error configuring hooks: {e}")
 
 def main():
+    # Fast path: `list` needs no argument parsing, so skip importing argparse
+    if sys.argv[1:] == ['list']:
+        list_accounts()
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser(description="Claude Account Manager")
     subparsers = parser.add_subparsers(dest='command')
 
@@ -1,25 +1,17 @@
 #!/usr/bin/env python3
 import os
-import json
 import sys
-import argparse
 import shlex
 
+from _manager_common import load_json, save_json
+
 CONFIG_FILE = os.path.expanduser("~/.claude-hooks/api_profiles.json")
 
 def load_config():
-    if not os.path.exists(CONFIG_FILE):
-        return {}
-    try:
-        with open(CONFIG_FILE, 'r') as f:
-            return json.load(f)
-    except:
-        return {}
+    return load_json(CONFIG_FILE)
 
 def save_config(config):
-    os.makedirs(os.path.dirname(CONFIG_FILE), exist_ok=True)
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    save_json(CONFIG_FILE, config)
 
 def add_api(name, env_vars):
     config = load_config()
@@ -71,6 +63,13 @@ def get_env(name):
             print(f"export {key}={shlex.quote(val)}")
 
 def main():
+    # Fast path: `get-env <name>` runs on every `c --api ...` launch, so skip argparse
+    if len(sys.argv) == 3 and sys.argv[1] == 'get-env' and not sys.argv[2].startswith('-'):
+        get_env(sys.argv[2])
+        return
+
+    import argparse
+
     parser = argparse.ArgumentParser()
     subparsers = parser.add_subparsers(dest='command')
 
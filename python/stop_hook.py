@@ -4,76 +4,70 @@ stop_hook.py - Claude Code Stop Hook
 Triggered by Claude Code's Stop event when the agent finishes
 Detects rate limit errors in the transcript
 """
-import json
 import sys
-import subprocess
 import os
-from collections import deque
+import re
 
-LOG_FILE = os.path.expanduser("~/.claude-hooks/python_debug.log")
-BIN_PATH = os.path.expanduser("~/Applications/ClaudeMonitor.app/Contents/MacOS/ClaudeMonitor")
+from _hook_common import get_account_alias, get_terminal_env, read_hook_input, send_notification as _send_notification, tagged_log
+
+# Transcripts can grow to megabytes; the tail is read back in steps of this many bytes
+TAIL_BYTES = 64 * 1024
 
 RATE_LIMIT_KEYWORDS = [
     'rate limit', 'rate_limit', 'too many requests',
     '429', 'quota exceeded', 'overloaded'
 ]
 
-def log(tag, msg):
-    try:
-        from datetime import datetime
-        with open(LOG_FILE, "a") as f:
-            f.write(f"[{datetime.now():%H:%M:%S}] [STOP-{tag}] {msg}\n")
-    except: pass
-
-def get_account_alias():
-    """Get account alias from environment variable or infer from config path"""
-    alias = os.environ.get('CLAUDE_ACCOUNT_ALIAS')
-    if alias:
-        return alias
-
-    config_dir = os.environ.get('CLAUDE_CONFIG_DIR', '')
-    if config_dir:
-        basename = os.path.basename(config_dir)
-        if basename == '.claude':
-            return 'default'
-        elif basename.startswith('.claude-'):
-            return basename[8:]
-
-    return 'default'
+# All keywords in one pattern so each line is scanned once, on raw bytes
+RATE_LIMIT_RE = re.compile(b'|'.join(re.escape(k.encode()) for k in RATE_LIMIT_KEYWORDS), re.IGNORECASE)
+
+log = tagged_log("STOP-")
 
 def get_last_n_lines(filepath, n=3):
-    """Read last n lines from file efficiently"""
+    """Read last n lines from file efficiently (reads backwards from the end, TAIL_BYTES at a time)"""
     try:
-        with open(os.path.expanduser(filepath), 'rb') as f:
-            return deque(f, n)
+        fd = os.open(os.path.expanduser(filepath), os.O_RDONLY)
+        try:
+            pos = os.fstat(fd).st_size
+            chunks = []
+            newlines = 0
+            # Records can be longer than one window, so keep stepping back until the
+            # window holds n+1 newlines (n complete lines) or reaches the start of the file
+            while pos > 0 and newlines <= n:
+                step = min(TAIL_BYTES, pos)
+                pos -= step
+                chunk = os.pread(fd, step, pos)
+                chunks.append(chunk)
+                newlines += chunk.count(b'\n')
+        finally:
+            os.close(fd)
     except Exception as e:
-        log("ERROR", f"Failed to read file: {e}")
+        log("ERROR", "Failed to read file: %s", e)
         return []
 
+    return b''.join(reversed(chunks)).splitlines(keepends=True)[-n:]
+
 def detect_rate_limit(transcript_path):
     """Check last 3 records in transcript for rate limit errors"""
     last_lines = get_last_n_lines(transcript_path, 3)
 
     for line in last_lines:
-        try:
-            content = line.decode('utf-8', errors='ignore').lower()
-            for keyword in RATE_LIMIT_KEYWORDS:
-                if keyword in content:
-                    return True, keyword
-        except: pass
+        match = RATE_LIMIT_RE.search(line)
+        if match:
+            return True, match.group(0).decode().lower()
 
     return False, None
 
 def send_notification(title, body, sound, bundle_id, pid, window_id):
     """Call Swift app to send notification with PID and window ID for window-level activation"""
     try:
-        subprocess.run([BIN_PATH, "notify", title, body, sound, bundle_id, str(pid), window_id], timeout=10)
+        _send_notification(title, body, sound, bundle_id, pid, window_id)
     except Exception as e:
-        log("ERROR", f"Notification failed: {e}")
+        log("ERROR", "Notification failed: %s", e)
 
 def main():
     try:
-        input_data = json.load(sys.stdin)
+        input_data = read_hook_input('transcript_path')
     except:
         sys.exit(0)
 
@@ -81,14 +75,12 @@ def main():
     if not transcript_path:
         sys.exit(0)
 
-    log("CHECK", f"Checking last 3 records in {transcript_path}")
+    log("CHECK", "Checking last 3 records in %s", transcript_path)
     has_rate_limit, keyword = detect_rate_limit(transcript_path)
 
     if has_rate_limit:
-        log("DETECTED", f"Rate limit found: {keyword}")
-        bundle_id = os.environ.get('CLAUDE_TERM_BUNDLE_ID', 'com.apple.Terminal')
-        pid = os.environ.get('CLAUDE_TERM_PID', '0')
-        window_id = os.environ.get('CLAUDE_CG_WINDOW_ID', '0')
+        log("DETECTED", "Rate limit found: %s", keyword)
+        bundle_id, pid, window_id = get_terminal_env()
         alias = get_account_alias()
 
         send_notification(
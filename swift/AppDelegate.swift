@@ -24,6 +24,9 @@ class AppDelegate: NSObject, NSApplicationDelegate, UNUserNotificationCenterDele
     func applicationDidFinishLaunching(_ notification: Notification) {
         log("APP_LAUNCH: App started")
 
+        // Accept notifications from hooks over the Unix socket while we're running
+        NotificationServer.shared.start()
+
         // Check if launched from notification click after a short delay
         // If no notification event received, this is a user-initiated launch (click app icon)
         // 0.3s to ensure notification callback has time to fire
@@ -38,6 +41,10 @@ class AppDelegate: NSObject, NSApplicationDelegate, UNUserNotificationCenterDele
         }
     }
 
+    func applicationWillTerminate(_ notification: Notification) {
+        NotificationServer.shared.stop()
+    }
+
     // MARK: - Handle App Reopen (click app icon while running)
 
     func applicationShouldHandleReopen(_ sender: NSApplication, hasVisibleWindows flag: Bool) -> Bool {
@@ -4,8 +4,11 @@ import Foundation
 
 let logPath = NSString(string: "~/.claude-hooks/swift_debug.log").expandingTildeInPath
 
+// Formatters are expensive to create; ISO8601DateFormatter is thread-safe, so share one
+private let logTimestampFormatter = ISO8601DateFormatter()
+
 func log(_ msg: String) {
-    let ts = ISO8601DateFormatter().string(from: Date())
+    let ts = logTimestampFormatter.string(from: Date())
     let entry = "[\(ts)] \(msg)\n"
     if let data = entry.data(using: .utf8) {
         if let fileHandle = FileHandle(forWritingAtPath: logPath) {
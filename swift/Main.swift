@@ -54,7 +54,7 @@ struct ClaudeMonitorApp {
             }
 
             // [Mode 2: Notifier]
-            // Called by Python Hook after Claude finishes.
+            // Called by Python Hook when no running ClaudeMonitor is listening on monitor.sock.
             // Args: notify <title> <message> [sound] [bundle_id] [pid] [cgWindowID]
             else if mode == "notify" {
                 guard args.count > 3 else { exit(1) }
@@ -65,38 +65,18 @@ struct ClaudeMonitorApp {
                 let targetPID: Int32 = args.count > 6 ? Int32(args[6]) ?? 0 : 0
                 let cgWindowID: UInt32 = args.count > 7 ? UInt32(args[7]) ?? 0 : 0
 
-                log("SEND: Title='\(title)' Target='\(targetBundle)' PID=\(targetPID) CGWindowID=\(cgWindowID)")
-
                 let center = UNUserNotificationCenter.current()
                 let sema = DispatchSemaphore(value: 0)
 
                 center.requestAuthorization(options: [.alert, .sound]) { _, _ in sema.signal() }
                 sema.wait()
 
-                let content = UNMutableNotificationContent()
-                content.title = title
-                content.body = message
-
-                // Set sound with validation (soundName is defined above)
-                if !soundName.isEmpty {
-                    content.sound = UNNotificationSound(named: UNNotificationSoundName(soundName))
-                }
-
-                // Log sound setting
-                log("SOUND: Using sound '\(soundName.isEmpty ? "system default" : soundName)'")
-
-                // Set app icon for notifications
-                let appBundleURL = Bundle.main.bundleURL
-                content.userInfo = [
-                    "targetBundle": targetBundle,
-                    "targetPID": targetPID,
-                    "cgWindowID": cgWindowID
-                ]
-
-                let req = UNNotificationRequest(identifier: UUID().uuidString, content: content, trigger: nil)
-
-                center.add(req) { err in
-                    if let e = err { log("SEND_ERR: \(e)") }
+                NotificationServer.shared.post(title: title,
+                                               message: message,
+                                               soundName: soundName,
+                                               targetBundle: targetBundle,
+                                               targetPID: targetPID,
+                                               cgWindowID: cgWindowID) {
                     exit(0)
                 }
                 RunLoop.main.run()
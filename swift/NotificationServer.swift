@@ -0,0 +1,196 @@
+import Foundation
+import UserNotifications
+
+// MARK: - Notification Server
+// While ClaudeMonitor is running it listens on ~/.claude-hooks/monitor.sock so hooks can
+// hand over a notification without cold-starting a new ClaudeMonitor process per event.
+// Each connection carries one newline-terminated JSON object with string fields:
+// {"title", "message", "sound", "bundle_id", "pid", "window_id"} (same as `notify` args).
+
+class NotificationServer {
+    static let shared = NotificationServer()
+    static let socketPath = NSString(string: "~/.claude-hooks/monitor.sock").expandingTildeInPath
+
+    private let queue = DispatchQueue(label: "com.custom.claude.monitor.socket")
+    private var listenFD: Int32 = -1
+    private var socketID: (dev: dev_t, ino: ino_t)?
+
+    private init() {}
+
+    // MARK: - Post Notification
+
+    func post(title: String, message: String, soundName: String,
+              targetBundle: String, targetPID: Int32, cgWindowID: UInt32,
+              completion: (() -> Void)? = nil) {
+        log("SEND: Title='\(title)' Target='\(targetBundle)' PID=\(targetPID) CGWindowID=\(cgWindowID)")
+
+        let content = UNMutableNotificationContent()
+        content.title = title
+        content.body = message
+
+        if !soundName.isEmpty {
+            content.sound = UNNotificationSound(named: UNNotificationSoundName(soundName))
+        }
+        log("SOUND: Using sound '\(soundName.isEmpty ? "system default" : soundName)'")
+
+        // Target window info is read back in userNotificationCenter(_:didReceive:) on click
+        content.userInfo = [
+            "targetBundle": targetBundle,
+            "targetPID": targetPID,
+            "cgWindowID": cgWindowID
+        ]
+
+        let req = UNNotificationRequest(identifier: UUID().uuidString, content: content, trigger: nil)
+
+        UNUserNotificationCenter.current().add(req) { err in
+            if let e = err { log("SEND_ERR: \(e)") }
+            completion?()
+        }
+    }
+
+    // MARK: - Socket Lifecycle
+
+    func start() {
+        guard listenFD < 0 else { return }
+
+        UNUserNotificationCenter.current().requestAuthorization(options: [.alert, .sound]) { _, _ in }
+
+        let path = NotificationServer.socketPath
+        guard var addr = NotificationServer.makeAddress(path) else {
+            log("SOCKET: Path too long: \(path)")
+            return
+        }
+
+        // Another ClaudeMonitor (e.g. the background instance while `gui` is open) may already
+        // own the socket. Only clear the path if nothing is answering on it.
+        let probe = socket(AF_UNIX, SOCK_STREAM, 0)
+        guard probe >= 0 else {
+            log("SOCKET: socket() failed errno=\(errno)")
+            return
+        }
+        let connected = withUnsafePointer(to: &addr) {
+            $0.withMemoryRebound(to: sockaddr.self, capacity: 1) {
+                connect(probe, $0, socklen_t(MemoryLayout<sockaddr_un>.size))
+            }
+        }
+        let probeErrno = errno
+        close(probe)
+        if connected == 0 {
+            log("SOCKET: Another instance is already listening on \(path)")
+            return
+        }
+        guard probeErrno == ECONNREFUSED || probeErrno == ENOENT else {
+            log("SOCKET: Probe failed errno=\(probeErrno), leaving \(path) alone")
+            return
+        }
+        unlink(path)
+
+        let fd = socket(AF_UNIX, SOCK_STREAM, 0)
+        guard fd >= 0 else {
+            log("SOCKET: socket() failed errno=\(errno)")
+            return
+        }
+
+        let bound = withUnsafePointer(to: &addr) {
+            $0.withMemoryRebound(to: sockaddr.self, capacity: 1) {
+                bind(fd, $0, socklen_t(MemoryLayout<sockaddr_un>.size))
+            }
+        }
+        guard bound == 0, listen(fd, 16) == 0 else {
+            log("SOCKET: bind/listen failed errno=\(errno)")
+            close(fd)
+            return
+        }
+
+        // Remember which file we created so stop() never removes another instance's socket
+        var st = stat()
+        if lstat(path, &st) == 0 {
+            socketID = (st.st_dev, st.st_ino)
+        }
+
+        listenFD = fd
+        log("SOCKET: Listening on \(path)")
+        queue.async { [weak self] in self?.acceptLoop(fd) }
+    }
+
+    func stop() {
+        guard listenFD >= 0 else { return }
+        close(listenFD)
+        listenFD = -1
+
+        let path = NotificationServer.socketPath
+        var st = stat()
+        if let id = socketID, lstat(path, &st) == 0, st.st_dev == id.dev, st.st_ino == id.ino {
+            unlink(path)
+        }
+        socketID = nil
+        log("SOCKET: Stopped")
+    }
+
+    private static func makeAddress(_ path: String) -> sockaddr_un? {
+        var addr = sockaddr_un()
+        addr.sun_family = sa_family_t(AF_UNIX)
+        let pathBytes = path.utf8CString
+        guard pathBytes.count <= MemoryLayout.size(ofValue: addr.sun_path) else { return nil }
+        withUnsafeMutableBytes(of: &addr.sun_path) { dst in
+            pathBytes.withUnsafeBytes { dst.copyMemory(from: $0) }
+        }
+        return addr
+    }
+
+    // MARK: - Request Handling
+
+    private func acceptLoop(_ fd: Int32) {
+        while true {
+            let client = accept(fd, nil, nil)
+            if client < 0 {
+                let err = errno
+                // Only stop() closing the socket ends the loop; hooks would otherwise keep
+                // connecting into a backlog nobody drains, and never fall back to `notify`
+                if listenFD < 0 || err == EBADF || err == EINVAL { break }
+                if err == EINTR { continue }
+                log("SOCKET: accept() failed errno=\(err)")
+                if err == EMFILE || err == ENFILE {
+                    usleep(100_000)  // out of descriptors: give in-flight clients time to close
+                }
+                continue
+            }
+            handle(client)
+        }
+    }
+
+    private func handle(_ client: Int32) {
+        defer { close(client) }
+
+        // Requests are handled one at a time on the accept thread, so a client that never
+        // finishes its line must not stall the hooks queued behind it
+        var timeout = timeval(tv_sec: 1, tv_usec: 0)
+        setsockopt(client, SOL_SOCKET, SO_RCVTIMEO, &timeout, socklen_t(MemoryLayout<timeval>.size))
+
+        var data = Data()
+        var buffer = [UInt8](repeating: 0, count: 4096)
+        while data.count < 65536 {
+            let n = read(client, &buffer, buffer.count)
+            if n <= 0 { break }
+            data.append(contentsOf: buffer[0..<n])
+            if buffer[0..<n].contains(UInt8(ascii: "\n")) { break }
+        }
+
+        // Connection probes from another instance's start() send nothing
+        guard !data.isEmpty else { return }
+
+        guard let request = (try? JSONSerialization.jsonObject(with: data)) as? [String: String],
+              let title = request["title"],
+              let message = request["message"] else {
+            log("SOCKET: Ignoring malformed request (\(data.count) bytes)")
+            return
+        }
+
+        post(title: title,
+             message: message,
+             soundName: request["sound"] ?? "Crystal",
+             targetBundle: request["bundle_id"] ?? "com.apple.Terminal",
+             targetPID: Int32(request["pid"] ?? "") ?? 0,
+             cgWindowID: UInt32(request["window_id"] ?? "") ?? 0)
+    }
+}